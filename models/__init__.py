@@ -1,7 +1,10 @@
 #!/usr/bin/python3
 """Initialize the FileStorage instance"""
-
+import atexit
 from models.engine.file_storage import FileStorage
 
 storage = FileStorage()
 storage.reload()
+
+# Write the changes still waiting in the storage when the program exits
+atexit.register(storage.flush)
@@ -1,9 +1,82 @@
 #!/usr/bin/python3
 """Base class for all models"""
-import uuid
+import os
 import datetime
+import threading
 import models
 
+_fromiso = datetime.datetime.fromisoformat
+_now = datetime.datetime.now
+_iso = datetime.datetime.isoformat
+
+# Converters applied to the stored (string) value of some attributes
+_CONVERTERS = {
+    'created_at': _fromiso,
+    'updated_at': _fromiso
+    }
+
+# models.storage doesn't exist yet while this module is imported,
+#   so it is cached on first use by _get_storage()
+_storage = None
+
+# Released instances kept for reuse, by class (see BaseModel.release)
+_POOL = {}
+_POOL_MAX = 1024
+
+# Random bytes are drawn from os.urandom in batches and sliced into ids
+_UUID_POOL = bytearray()
+_UUID_OFF = 0
+_UUID_LOCK = threading.Lock()
+
+
+def _fast_uuid4():
+    """Generate a random (version 4) UUID string
+
+    Returns:
+        The UUID formatted as 8-4-4-4-12 hex digits, like str(uuid.uuid4())
+    """
+    global _UUID_POOL, _UUID_OFF
+
+    with _UUID_LOCK:
+        if _UUID_OFF >= len(_UUID_POOL):
+            _UUID_POOL = bytearray(os.urandom(16 * 512))
+            _UUID_OFF = 0
+        b = _UUID_POOL[_UUID_OFF:_UUID_OFF + 16]
+        _UUID_OFF += 16
+
+    # Set the version (4) and the variant (RFC 4122) bits
+    b[6] = (b[6] & 0x0f) | 0x40
+    b[8] = (b[8] & 0x3f) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _reset_uuid_pool():
+    """Drop the random bytes inherited from the parent process, so a
+    forked child doesn't hand out the same ids as its parent
+    """
+    global _UUID_POOL, _UUID_OFF, _UUID_LOCK
+
+    _UUID_POOL = bytearray()
+    _UUID_OFF = 0
+    _UUID_LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
+
+
+def _get_storage():
+    """Resolve and cache the shared storage instance
+
+    Returns:
+        The models.storage instance
+    """
+    global _storage
+
+    _storage = models.storage
+    return _storage
+
 
 class BaseModel():
     """BaseModel
@@ -11,19 +84,31 @@ class BaseModel():
         Contains all the necassary and shared attributes/methods.
     """
 
+    # _iso_cache lives outside __dict__, so it never shows up in
+    #   __str__ or to_dict
+    __slots__ = ('__dict__', '__weakref__', '_iso_cache')
+
+    _cls_name = 'BaseModel'
+
+    def __init_subclass__(cls, **kwargs):
+        """Store the class name once, when a subclass is defined."""
+
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+
     def __init__(self, *args, **kwargs):
         """Constructor for the BaseModel class
         desc:
             Initialize all the mandatory attributes.
         """
 
-        if len(kwargs) != 0:
+        if kwargs:
             self.create(**kwargs)
         else:
-            self.id = str(uuid.uuid4())
-            self.created_at = datetime.datetime.now()
+            self.id = _fast_uuid4()
+            self.created_at = _now()
             self.updated_at = self.created_at
-            models.storage.new(self)
+            (_storage or _get_storage()).new(self)
 
     def create(self, **dictionary):
         """Update the class Base and returns a instance with all
@@ -33,19 +118,62 @@ class BaseModel():
         Return:
             An instance with all attributes already set
         """
+        # dictionary is the kwargs dict built for this call,
+        #   so it can be changed in place
+        dictionary.pop('__class__', None)
+        conv = _CONVERTERS.get
+        obj_dict = self.__dict__
+        for key, value in dictionary.items():
+            converter = conv(key)
+            if converter is not None:
+                value = converter(value)
+
+            obj_dict[key] = value
+
+    @classmethod
+    def from_dict(cls, dictionary):
+        """Build an instance from its dictionary representation without
+            going through __init__ (used to reload the storage file)
+        Args:
+            dictionary: Dictionary with all attributes of the object
+        Return:
+            An instance with all attributes already set
+        """
+        obj = cls.__new__(cls)
+        conv = _CONVERTERS.get
+        obj_dict = obj.__dict__
         for key, value in dictionary.items():
-            if key == '__class__':
-                continue
-            elif key == 'created_at':
-                value = datetime.datetime.fromisoformat(
-                    dictionary['created_at']
-                    )
-            elif key == 'updated_at':
-                value = datetime.datetime.fromisoformat(
-                    dictionary['updated_at']
-                    )
-
-            setattr(self, key, value)
+            converter = conv(key)
+            obj_dict[key] = value if converter is None else converter(value)
+
+        # dictionary belongs to the caller, so the key is dropped from the
+        #   instance's attributes instead
+        obj_dict.pop('__class__', None)
+        return obj
+
+    @classmethod
+    def acquire(cls):
+        """Get an empty instance, reusing a released one if any.
+            __init__ isn't called, so the instance has no attributes
+            and isn't added to the storage.
+        Return:
+            An empty instance of the class
+        """
+        pool = _POOL.get(cls)
+        if pool:
+            return pool.pop()
+        return cls.__new__(cls)
+
+    def release(self):
+        """Give the instance back for reuse by acquire.
+            Opt-in: only call it when nothing else (the storage included)
+            still references the instance, its attributes are dropped.
+        """
+        self.__dict__.clear()
+        self._iso_cache = None
+        pool = _POOL.setdefault(self.__class__, [])
+        if len(pool) < _POOL_MAX:
+            pool.append(self)
 
     def __str__(self):
         """Convert the instance to string.
@@ -54,25 +182,60 @@ class BaseModel():
             Human readable representation of the class.
         """
 
-        return f"[{self.__class__.__name__}] ({self.id}) {self.__dict__}"
+        return "[%s] (%s) %s" % (self._cls_name, self.id, self.__dict__)
 
     def save(self):
         """Update the updated_at instance attribute."""
 
-        self.updated_at = datetime.datetime.now()
-        models.storage.save()
+        self.updated_at = _now()
+        (_storage or _get_storage()).mark_dirty(self)
 
-    def to_dict(self):
+    @classmethod
+    def save_many(cls, objs):
+        """Update the updated_at attribute of several instances, then
+            write the storage file once.
+        Args:
+            objs: Iterable of the instances to save
+        """
+        now = _now()
+        for obj in objs:
+            obj.updated_at = now
+        (_storage or _get_storage()).save()
+
+    def to_dict(self, *, out=None):
         """Convert the instance to its dictionary representation
 
+        Keyword Arguments:
+            out -- Dictionary to fill instead of a new one, it's
+                cleared first (caller reuses it across objects)
+
         Returns:
             All the instance attributes in a dictionary
         """
 
-        instance_to_dict = self.__dict__.copy()
-        instance_to_dict.update({
-            '__class__': self.__class__.__name__,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
-            })
-        return instance_to_dict
+        created_at = self.created_at
+        updated_at = self.updated_at
+
+        # datetimes are immutable, so the cached strings are still valid
+        #   as long as both attributes hold the same objects
+        cache = getattr(self, '_iso_cache', None)
+        if cache is None or cache[0] is not created_at or \
+                cache[1] is not updated_at:
+            cache = (created_at, updated_at,
+                     _iso(created_at), _iso(updated_at))
+            self._iso_cache = cache
+
+        if out is None:
+            return {
+                **self.__dict__,
+                '__class__': self._cls_name,
+                'created_at': cache[2],
+                'updated_at': cache[3]
+                }
+
+        out.clear()
+        out.update(self.__dict__)
+        out['__class__'] = self._cls_name
+        out['created_at'] = cache[2]
+        out['updated_at'] = cache[3]
+        return out
@@ -27,6 +27,11 @@ class FileStorage():
     """
     __file_path = "file.json"
     __objects = {}
+    __dirty = set()
+
+    # Number of saved (dirty) objects that triggers a write of the file,
+    #   raise it to coalesce many saves into fewer writes
+    flush_threshold = 1
 
     def all(self):
         """All stored objects
@@ -36,6 +41,12 @@ class FileStorage():
         """
         return self.__objects
 
+    def clear(self):
+        """Remove all objects from memory, the file is left untouched
+        """
+        self.__objects.clear()
+        self.__dirty.clear()
+
     def new(self, obj):
         """Save a new object
 
@@ -44,9 +55,27 @@ class FileStorage():
         """
         self.__objects.update({f'{obj.__class__.__name__}.{obj.id}': obj})
 
+    def mark_dirty(self, obj):
+        """Record a changed object, the file is written once
+            flush_threshold objects are waiting to be saved
+
+        Arguments:
+            obj -- The changed object
+        """
+        self.__dirty.add(f'{obj.__class__.__name__}.{obj.id}')
+        if len(self.__dirty) >= self.flush_threshold:
+            self.save()
+
+    def flush(self):
+        """Save all objects to a file if some changes aren't saved yet
+        """
+        if self.__dirty:
+            self.save()
+
     def save(self):
         """Save all objects to a file
         """
+        self.__dirty.clear()
         obj_to_json = {}
         for key, value in self.all().items():
             obj_to_json[key] = value.to_dict()
@@ -64,6 +93,8 @@ class FileStorage():
             return
 
         # Search for the specified class in models_dict dictionary
-        #   with its name, then initialize it.
+        #   with its name, then rebuild it from its dictionary.
         for key, value in json_objects.items():
-            self.__objects[key] = models_dict[value['__class__']](**value)
+            self.__objects[key] = models_dict[value['__class__']].from_dict(
+                value
+                )
@@ -17,32 +17,34 @@ import json
 class TestAmenityInit(unittest.TestCase):
     """Test cases for the initialization of the Amenity class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -175,32 +177,34 @@ class TestAmenityInit(unittest.TestCase):
 class TestAmenityStr(unittest.TestCase):
     """Test cases for the __str__ method of the Amenity class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -226,32 +230,34 @@ class TestAmenityStr(unittest.TestCase):
 class TestAmenitySave(unittest.TestCase):
     """Test cases for the save method of the Amenity class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -308,32 +314,34 @@ class TestAmenitySave(unittest.TestCase):
 class TestAmenityToDict(unittest.TestCase):
     """Test cases for the to_dict method of the Amenity class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
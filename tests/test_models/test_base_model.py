@@ -12,6 +12,7 @@ from models.base_model import BaseModel
 import models
 from time import sleep
 import json
+import uuid
 
 
 class TestBaseModelInit(unittest.TestCase):
@@ -21,32 +22,34 @@ class TestBaseModelInit(unittest.TestCase):
         unittest -- Inherits unittest.TestCase's attributes and methods
     """
 
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -70,6 +73,31 @@ class TestBaseModelInit(unittest.TestCase):
         ids = {obj1.id, obj2.id, obj3.id, obj4.id}
         self.assertTrue(len(ids) == 4)
 
+    def test_id_is_uuid4(self):
+        """Test if the id is a valid version 4 UUID string
+        """
+        obj = BaseModel()
+        self.assertEqual(obj.id, str(uuid.UUID(obj.id, version=4)))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_uniq_id_after_fork(self):
+        """Test if a forked process doesn't reuse the parent's ids
+        """
+        BaseModel()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, BaseModel().id.encode())
+            os._exit(0)
+        os.close(write_fd)
+        parent_id = BaseModel().id
+        with os.fdopen(read_fd, 'rb') as f:
+            child_id = f.read().decode()
+        os.waitpid(pid, 0)
+        self.assertEqual(36, len(child_id))
+        self.assertNotEqual(parent_id, child_id)
+
     def test_same_createdAt_updatedAt(self):
         """Test if created_at and updated_at are the same
         """
@@ -166,32 +194,34 @@ class TestBaseModelStr(unittest.TestCase):
     """This class contains test cases for the __str__ method of
     the BaseModel class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -217,32 +247,34 @@ class TestBaseModelSave(unittest.TestCase):
     """This class contains test cases for the save method of the
     BaseModel class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -289,37 +321,53 @@ class TestBaseModelSave(unittest.TestCase):
             instances = json.load(f)
         self.assertIn(obj.to_dict(), list(instances.values()))
 
+    def test_save_many(self):
+        """Tests if save_many updates all the objects and saves them.
+        """
+        obj1 = BaseModel()
+        obj2 = BaseModel()
+        prev_updated = obj1.updated_at
+        BaseModel.save_many([obj1, obj2])
+        self.assertGreater(obj1.updated_at, prev_updated)
+        self.assertEqual(obj1.updated_at, obj2.updated_at)
+        with open('file.json', 'r') as f:
+            instances = json.load(f)
+        self.assertIn(obj1.to_dict(), list(instances.values()))
+        self.assertIn(obj2.to_dict(), list(instances.values()))
+
 
 class TestBaseModelToDict(unittest.TestCase):
     """This class contains test cases for the to_dict method
     of the BaseModel class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -393,6 +441,87 @@ class TestBaseModelToDict(unittest.TestCase):
         for key, value in obj.to_dict().items():
             self.assertEqual(dict1[key], value)
 
+    def test_to_dict_out(self):
+        """Tests if to_dict fills and returns the given dictionary.
+        """
+        obj = BaseModel()
+        out = {'foo': 'bar'}
+        data = obj.to_dict(out=out)
+        self.assertIs(out, data)
+        self.assertDictEqual(obj.to_dict(), data)
+
+    def test_dict_dates_after_change(self):
+        """Tests if the dates in the dictionary follow changes made
+        after a previous call.
+        """
+        obj = BaseModel()
+        obj.to_dict()
+        date = datetime.datetime(2024, 1, 14, 17, 7, 0, 0)
+        obj.created_at = date
+        self.assertEqual(obj.to_dict()['created_at'], date.isoformat())
+        obj.save()
+        self.assertEqual(
+            obj.to_dict()['updated_at'],
+            obj.updated_at.isoformat()
+            )
+
+
+class TestBaseModelFromDict(unittest.TestCase):
+    """This class contains test cases for the from_dict class method
+    of the BaseModel class.
+    """
+
+    def test_from_dict_values(self):
+        """Tests if the rebuilt object has the same dictionary
+        representation.
+        """
+        date = datetime.datetime(2024, 1, 14, 17, 7, 0, 0).isoformat()
+        dict1 = {
+            'id': '1809',
+            'created_at': date,
+            'updated_at': date,
+            '__class__': 'BaseModel',
+            'name': 'Zakaria'
+            }
+        obj = BaseModel.from_dict(dict1)
+        self.assertEqual(datetime.datetime, type(obj.created_at))
+        self.assertDictEqual(dict1, obj.to_dict())
+
+    def test_from_dict_not_in_storage(self):
+        """Tests if from_dict doesn't add the object to the storage.
+        """
+        obj = BaseModel.from_dict({'id': '1809'})
+        self.assertNotIn(obj, models.storage.all().values())
+
+    def test_from_dict_wrong_date(self):
+        """Tests ValueError when created_at isn't an ISO formatted date.
+        """
+        with self.assertRaises(ValueError):
+            BaseModel.from_dict({'id': '1809', 'created_at': '1809'})
+
+
+class TestBaseModelPool(unittest.TestCase):
+    """This class contains test cases for the acquire and release
+    methods of the BaseModel class.
+    """
+
+    def test_acquire_empty_instance(self):
+        """Tests if acquire returns an instance without attributes.
+        """
+        obj = BaseModel.acquire()
+        self.assertIsInstance(obj, BaseModel)
+        self.assertDictEqual({}, obj.__dict__)
+
+    def test_released_instance_reused(self):
+        """Tests if a released instance is reused and cleared.
+        """
+        obj = BaseModel.from_dict({'id': '1809', 'name': 'Zakaria'})
+        obj.release()
+        obj2 = BaseModel.acquire()
+        self.assertIs(obj, obj2)
+        self.assertDictEqual({}, obj2.__dict__)
+        self.assertIsNot(obj, BaseModel.acquire())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,32 +18,34 @@ import json
 class TestCityInit(unittest.TestCase):
     """Test cases for the initialization of the City class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -197,32 +199,34 @@ class TestCityInit(unittest.TestCase):
 class TestCityStr(unittest.TestCase):
     """Test cases for the __str__ method of the City class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -249,32 +253,34 @@ class TestCityStr(unittest.TestCase):
 class TestCitySave(unittest.TestCase):
     """Test cases for the save method of the City class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -336,32 +342,34 @@ class TestCitySave(unittest.TestCase):
 class TestCityToDict(unittest.TestCase):
     """Test cases for the to_dict method of the City class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
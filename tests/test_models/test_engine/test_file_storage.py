@@ -21,39 +21,37 @@ class TestFileStorageAttrs(unittest.TestCase):
     Arguments:
         unittest -- Inherits unittest.TestCase's attributes and methods
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-
-        # Initialize new storage before each test
-        models.FileStorage._FileStorage__objects = {}
+        models.storage.clear()
 
         try:
             os.remove('file.json')
         except FileNotFoundError:
             pass
 
-        try:
-            os.rename('temp', 'file.json')
-        except FileNotFoundError:
-            pass
-
         return super().tearDown()
 
     def test_the_private_attributes_objects_type(self):
@@ -102,39 +100,37 @@ class TestFileStorageAll(unittest.TestCase):
         and methods
     """
 
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-
-        # Initialize new storage before each test
-        models.FileStorage._FileStorage__objects = {}
+        models.storage.clear()
 
         try:
             os.remove('file.json')
         except FileNotFoundError:
             pass
 
-        try:
-            os.rename('temp', 'file.json')
-        except FileNotFoundError:
-            pass
-
         return super().tearDown()
 
     def test_new_object_in_objects_attr(self):
@@ -171,6 +167,15 @@ class TestFileStorageAll(unittest.TestCase):
         with self.assertRaises(TypeError):
             models.storage.new(BaseModel(), 'argument')
 
+    def test_clear_objects(self):
+        """Tests if clear empties the __objects attribute but keeps
+        the saved file.
+        """
+        BaseModel().save()
+        models.storage.clear()
+        self.assertDictEqual({}, models.storage.all())
+        self.assertTrue(os.path.exists('file.json'))
+
 
 class TestFileStorageSave(unittest.TestCase):
     """Test the save method of the FileStorage class.
@@ -179,39 +184,37 @@ class TestFileStorageSave(unittest.TestCase):
         unittest -- Inherits unittest.TestCase's attributes and methods
     """
 
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-
-        # Initialize new storage before each test
-        models.FileStorage._FileStorage__objects = {}
+        models.storage.clear()
 
         try:
             os.remove('file.json')
         except FileNotFoundError:
             pass
 
-        try:
-            os.rename('temp', 'file.json')
-        except FileNotFoundError:
-            pass
-
         return super().tearDown()
 
     def test_with_additional_args(self):
@@ -242,6 +245,44 @@ class TestFileStorageSave(unittest.TestCase):
         with self.assertRaises(AttributeError):
             models.storage.save()
 
+    def test_saves_coalesced_until_threshold(self):
+        """Tests if the file is written only once flush_threshold objects
+        were saved.
+        """
+        models.storage.flush_threshold = 2
+        try:
+            obj1 = BaseModel()
+            obj1.save()
+            self.assertFalse(os.path.exists('file.json'))
+            obj1.save()
+            self.assertFalse(os.path.exists('file.json'))
+            obj2 = BaseModel()
+            obj2.save()
+            with open('file.json', 'r') as file:
+                json_data = json.load(file)
+            self.assertIn(obj1.to_dict(), list(json_data.values()))
+            self.assertIn(obj2.to_dict(), list(json_data.values()))
+        finally:
+            del models.storage.flush_threshold
+
+    def test_flush_pending_saves(self):
+        """Tests if flush writes the saved objects to the file, and does
+        nothing when there are none.
+        """
+        models.storage.flush()
+        self.assertFalse(os.path.exists('file.json'))
+        models.storage.flush_threshold = 10
+        try:
+            obj = BaseModel()
+            obj.save()
+            self.assertFalse(os.path.exists('file.json'))
+            models.storage.flush()
+            with open('file.json', 'r') as file:
+                json_data = json.load(file)
+            self.assertIn(obj.to_dict(), list(json_data.values()))
+        finally:
+            del models.storage.flush_threshold
+
     def test_saved_empty_objects_attribute(self):
         """Tests the behavior of saving when the __objects attribute is empty.
         """
@@ -258,39 +299,37 @@ class TestFileStorageReload(unittest.TestCase):
         unittest -- Inherits unittest.TestCase's attributes and methods
     """
 
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-
-        # Initialize new storage before each test
-        models.FileStorage._FileStorage__objects = {}
+        models.storage.clear()
 
         try:
             os.remove('file.json')
         except FileNotFoundError:
             pass
 
-        try:
-            os.rename('temp', 'file.json')
-        except FileNotFoundError:
-            pass
-
         return super().tearDown()
 
     def test_with_additional_args(self):
@@ -363,6 +402,24 @@ class TestFileStorageReload(unittest.TestCase):
         models.storage.reload()
         self.assertDictEqual({}, models.storage.all())
 
+    def test_reload_values_beyond_json_types(self):
+        """Ensures that integers beyond 64 bits and NaN/Infinity, which
+        the console accepts, are saved and reloaded unchanged.
+        """
+        obj = BaseModel()
+        obj.big = 123456789012345678901234
+        obj.nan = float('nan')
+        obj.inf = float('inf')
+        obj.save()
+        models.storage.clear()
+        models.storage.reload()
+
+        obj2 = models.storage.all()[f'BaseModel.{obj.id}']
+        self.assertEqual(123456789012345678901234, obj2.big)
+        self.assertEqual(int, type(obj2.big))
+        self.assertNotEqual(obj2.nan, obj2.nan)
+        self.assertEqual(float('inf'), obj2.inf)
+
     def test_new_object_before_saving_exists_after_reload(self):
         """Ensures that the new objects before saving them in a file
         are exist after reloading objects from a file.
@@ -20,32 +20,34 @@ import json
 class TestPlaceInit(unittest.TestCase):
     """Test cases for the initialization of the Place class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -290,32 +292,34 @@ class TestPlaceInit(unittest.TestCase):
 class TestPlaceStr(unittest.TestCase):
     """Test cases for the __str__ method of the Place class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -355,32 +359,34 @@ class TestPlaceStr(unittest.TestCase):
 class TestPlaceSave(unittest.TestCase):
     """Test cases for the save method of the Place class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 
@@ -482,32 +488,34 @@ class TestPlaceSave(unittest.TestCase):
 class TestPlaceToDict(unittest.TestCase):
     """Test cases for the to_dict method of the Place class.
     """
-    def setUp(self):
-        """Rename the storage file, so it doesn't get overwrited
-
-        Returns:
-            The default behavior of the parent class
+    @classmethod
+    def setUpClass(cls):
+        """Rename the storage file once, so it doesn't get overwrited
         """
         try:
             os.rename('file.json', 'temp')
         except FileNotFoundError:
             pass
 
-        return super().setUp()
+    @classmethod
+    def tearDownClass(cls):
+        """Reset the storage file name to its default
+        """
+        try:
+            os.rename('temp', 'file.json')
+        except FileNotFoundError:
+            pass
 
     def tearDown(self):
-        """Reset the storage file name to its default
+        """Empty the storage and remove the file saved by the test
 
         Returns:
             The default behavior of the parent class
         """
-        try:
-            os.remove('file.json')
-        except FileNotFoundError:
-            pass
+        models.storage.clear()
 
         try:
-            os.rename('temp', 'file.json')
+            os.remove('file.json')
         except FileNotFoundError:
             pass
 